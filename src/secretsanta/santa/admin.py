@@ -1,4 +1,3 @@
-from django.conf import settings
 from django.contrib import admin
 from django.utils import formats
 from django.utils.html import format_html
@@ -6,12 +5,12 @@ from django.utils.html import format_html
 from . import models
 
 
-def _format_datetime(template, function, description):
+def _format_datetime(format_name, function, description):
     def output(self, obj):
         value = function(obj)
         if value is None:
             return ""
-        value = formats.date_format(value, template)
+        value = formats.date_format(value, format_name)
         return format_html('<span style="white-space: nowrap;">{0}</span>', value)
 
     output.short_description = description
@@ -32,7 +31,7 @@ class GroupAdmin(admin.ModelAdmin):
             "Members",
             {
                 "classes": ("wide"),
-                "fields": ("members__username",),
+                "fields": ("members__username", "member_count", "wishlist_count"),
             },
         ),
         (
@@ -50,10 +49,18 @@ class GroupAdmin(admin.ModelAdmin):
             },
         ),
     ]
-    list_display = ("name", "created_by", "_event_date", "is_matched", "completed")
+    list_display = (
+        "name",
+        "created_by",
+        "_event_date",
+        "member_count",
+        "wishlist_count",
+        "is_matched",
+        "completed",
+    )
     date_hierarchy = "event_date"
     list_filter = ("is_matched",)
-    readonly_fields = ("created_by", "created_at")
+    readonly_fields = ("created_by", "created_at", "member_count", "wishlist_count")
     ordering = ("name", "event_date", "created_at")
     search_fields = ("name", "created_by__username")
 
@@ -66,7 +73,7 @@ class GroupAdmin(admin.ModelAdmin):
         return obj.completed
 
     _event_date = _format_datetime(
-        settings.DATETIME_FORMAT,
+        "DATETIME_FORMAT",
         lambda obj: obj.event_date,
         description="Event Date & Time",
     )
@@ -97,7 +104,7 @@ class GroupMemberAdmin(admin.ModelAdmin):
     readonly_fields = ("joined_at",)
 
     _joined_at = _format_datetime(
-        settings.DATETIME_FORMAT,
+        "DATETIME_FORMAT",
         lambda obj: obj.joined_at,
         description="Joined at Date & Time",
     )
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from santa import models
+
+
+def _drifted(groups):
+    return groups.annotate(
+        actual_member_count=Count("group_members"),
+        actual_wishlist_count=Count(
+            "group_members",
+            filter=Q(group_members__wishlist__isnull=False)
+            & ~Q(group_members__wishlist=""),
+        ),
+    ).exclude(
+        member_count=F("actual_member_count"),
+        wishlist_count=F("actual_wishlist_count"),
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the denormalized member_count and wishlist_count of every "
+        "Group in a single aggregated query and fixes the ones that drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the drifted groups without updating them.",
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        drifted_pks = list(
+            _drifted(models.Group.objects.all()).values_list("pk", flat=True)
+        )
+        # Row locks cannot be combined with the aggregate, so lock the drifted
+        # groups first and then count again: a concurrent join, leave or
+        # wishlist change has either committed by now and is counted, or its
+        # F() update waits for the lock and applies on top of the new values.
+        list(
+            models.Group.objects.select_for_update()
+            .filter(pk__in=drifted_pks)
+            .values_list("pk", flat=True)
+        )
+        drifted = list(_drifted(models.Group.objects.filter(pk__in=drifted_pks)))
+
+        for group in drifted:
+            self.stdout.write(
+                f"{group}: members {group.member_count} -> "
+                f"{group.actual_member_count}, wishlists "
+                f"{group.wishlist_count} -> {group.actual_wishlist_count}"
+            )
+            group.member_count = group.actual_member_count
+            group.wishlist_count = group.actual_wishlist_count
+
+        if options["dry_run"]:
+            self.stdout.write(f"Found {len(drifted)} drifted group(s).")
+            return
+
+        models.Group.objects.bulk_update(drifted, models.Group.COUNTER_FIELDS)
+        self.stdout.write(self.style.SUCCESS(f"Repaired {len(drifted)} group(s)."))
@@ -0,0 +1,144 @@
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+ENTRY_POINTS = {
+    "wsgi": "secretsanta.wsgi",
+    "asgi": "secretsanta.asgi",
+}
+
+# Runs in a fresh interpreter so that nothing is imported yet; prints the
+# wall-clock time it took for the entry point to become ready to serve.
+CHILD_SCRIPT = (
+    "import time; started = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def _parse_importtime(output):
+    """
+    Parses the `-X importtime` report written by the interpreter to stderr.
+
+    Returns
+    -------
+        A list of `(module, self_us, cumulative_us)` tuples, in the
+        order the interpreter reported them.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            # Header line.
+            continue
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the cold start of the WSGI/ASGI entry point in a fresh "
+        "interpreter and breaks the import time down by package."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entry-point",
+            choices=sorted(ENTRY_POINTS),
+            default="wsgi",
+            help="Entry point to import. Defaults to wsgi.",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Number of cold starts to time; the median is reported.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=15,
+            help="Number of packages to list in the breakdown.",
+        )
+        parser.add_argument(
+            "--max-ms",
+            type=float,
+            default=getattr(settings, "STARTUP_TIME_BUDGET_MS", None),
+            help=(
+                "Fail if the median cold start exceeds this many milliseconds. "
+                "Defaults to the STARTUP_TIME_BUDGET_MS setting."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1:
+            raise CommandError("--runs must be at least 1.")
+
+        module = ENTRY_POINTS[options["entry_point"]]
+        # `-X importtime` adds noticeable overhead of its own, so it is only
+        # used for the breakdown; the budget is checked against plain runs.
+        _, report = self._cold_start(module, "-X", "importtime")
+        self._report_breakdown(_parse_importtime(report), options["top"])
+
+        wall_times = [self._cold_start(module)[0] for _ in range(options["runs"])]
+        median_ms = statistics.median(wall_times) * 1000
+        self.stdout.write(
+            f"Cold start of {module} ({settings.SETTINGS_MODULE}): "
+            f"{median_ms:.1f} ms median over {options['runs']} run(s)"
+        )
+
+        max_ms = options["max_ms"]
+        if max_ms is not None and median_ms > max_ms:
+            raise CommandError(
+                f"Cold start of {median_ms:.1f} ms exceeds the {max_ms:.0f} ms budget."
+            )
+        if max_ms is not None:
+            self.stdout.write(self.style.SUCCESS(f"Within the {max_ms:.0f} ms budget."))
+
+    def _cold_start(self, module, *interpreter_options):
+        """
+        Imports `module` in a fresh interpreter.
+
+        Returns
+        -------
+            The wall-clock time the import took, in seconds, and whatever the
+            interpreter wrote to stderr.
+        """
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        result = subprocess.run(
+            [
+                sys.executable,
+                *interpreter_options,
+                "-c",
+                CHILD_SCRIPT.format(module=module),
+            ],
+            capture_output=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Importing {module} failed:\n{result.stderr}")
+        return float(result.stdout.splitlines()[-1]), result.stderr
+
+    def _report_breakdown(self, imports, top):
+        # Self times are attributed to each module's top-level package; the
+        # cumulative ones would count nested imports towards every importer.
+        packages = defaultdict(int)
+        for module, self_us, _ in imports:
+            packages[module.split(".")[0]] += self_us
+
+        total_us = sum(packages.values())
+        self.stdout.write(f"{'package':<40} {'self ms':>14} {'share':>7}")
+        for package, self_us in sorted(
+            packages.items(), key=lambda item: item[1], reverse=True
+        )[:top]:
+            share = self_us / total_us if total_us else 0
+            self.stdout.write(f"{package:<40} {self_us / 1000:>14.1f} {share:>7.1%}")
+        self.stdout.write(f"{'total imports':<40} {total_us / 1000:>14.1f}")
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.3 on 2026-10-19 10:12
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counts(apps, schema_editor):
+    Group = apps.get_model("santa", "Group")
+    groups = Group.objects.annotate(
+        actual_member_count=Count("group_members"),
+        actual_wishlist_count=Count(
+            "group_members",
+            filter=Q(group_members__wishlist__isnull=False)
+            & ~Q(group_members__wishlist=""),
+        ),
+    )
+    for group in groups:
+        group.member_count = group.actual_member_count
+        group.wishlist_count = group.actual_wishlist_count
+    Group.objects.bulk_update(groups, ["member_count", "wishlist_count"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("santa", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="member_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Members"
+            ),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="wishlist_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Wishlists Filled"
+            ),
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
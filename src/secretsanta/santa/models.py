@@ -1,7 +1,11 @@
 from datetime import datetime
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy
 
@@ -13,6 +17,8 @@ class Group(models.Model):
         verbose_name = gettext_lazy("Group")
         verbose_name_plural = gettext_lazy("Groups")
 
+    COUNTER_FIELDS = ("member_count", "wishlist_count")
+
     name = models.CharField(max_length=100, verbose_name=gettext_lazy("Group Name"))
     description = models.TextField(
         blank=True, null=True, verbose_name=gettext_lazy("Group's Description")
@@ -41,10 +47,94 @@ class Group(models.Model):
     is_matched = models.BooleanField(
         default=False, verbose_name=gettext_lazy("Have the matches been completed?")
     )
+    # Denormalized counters over `group_member`, only ever written through
+    # `adjust_counts` (see `save`) by the `GroupMember` signal receivers below.
+    # Use the `repair_group_counts` command if they ever drift.
+    member_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=gettext_lazy("Number of Members")
+    )
+    wishlist_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=gettext_lazy("Wishlists Filled")
+    )
 
     def __str__(self):
         return f"Group: {self.name}"
 
+    def save(self, *args, **kwargs):
+        """
+        Saves the `Group`, first reloading the counters under a row lock so that
+        a stale instance cannot undo the atomic updates of `adjust_counts`.
+
+        Inserts and saves with explicit `update_fields` are left alone.
+        """
+        if (
+            self._state.adding
+            or kwargs.get("force_insert")
+            or kwargs.get("update_fields") is not None
+        ):
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            counts = (
+                Group.objects.select_for_update()
+                .filter(pk=self.pk)
+                .values_list(*self.COUNTER_FIELDS)
+                .first()
+            )
+            # The row may be gone, in which case `save` inserts it again.
+            if counts is not None:
+                self.member_count, self.wishlist_count = counts
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def adjust_counts(cls, pk, members=0, wishlists=0):
+        """
+        Atomically adds `members` and `wishlists` to the counters of the
+        `Group` with primary key `pk`.
+
+        The counters are clamped at zero, so that a counter that has drifted
+        low cannot make deleting a membership fail.
+        """
+        cls.objects.filter(pk=pk).update(
+            member_count=Greatest(F("member_count") + members, Value(0)),
+            wishlist_count=Greatest(F("wishlist_count") + wishlists, Value(0)),
+        )
+
+    def add_member(self, user):
+        """
+        Adds `user` to the `Group` and increments `member_count`.
+
+        Returns
+        -------
+            The newly created `GroupMember`.
+        """
+        # The counters are adjusted by `_membership_saved`.
+        membership = GroupMember.objects.create(user=user, group=self)
+        self.refresh_from_db(fields=self.COUNTER_FIELDS)
+        return membership
+
+    def remove_member(self, user):
+        """
+        Removes `user` from the `Group` and decrements `member_count`, as well as
+        `wishlist_count` if the member had filled in their wishlist.
+
+        Returns
+        -------
+            `True` in case `user` was a member of the `Group`.
+            `False` otherwise.
+        """
+        with transaction.atomic():
+            membership = (
+                GroupMember.objects.select_for_update()
+                .filter(user=user, group=self)
+                .first()
+            )
+            if membership is None:
+                return False
+            # The counters are adjusted by `_membership_deleted`.
+            membership.delete()
+        self.refresh_from_db(fields=self.COUNTER_FIELDS)
+        return True
+
     @property
     def completed(self):
         """
@@ -96,3 +186,81 @@ class GroupMember(models.Model):
 
     def __str__(self):
         return f"{self.user.username} in {self.group.name}"
+
+    @property
+    def has_wishlist(self):
+        """
+        Determines if the member has filled in their wishlist.
+        """
+        return bool(self.wishlist)
+
+    def update_wishlist(self, wishlist):
+        """
+        Saves `wishlist`, locking the membership so that concurrent updates
+        adjust the `Group`'s `wishlist_count` only once.
+        """
+        with transaction.atomic():
+            GroupMember.objects.select_for_update().values_list("pk").get(pk=self.pk)
+            self.wishlist = wishlist
+            # The counters are adjusted by `_membership_saved`.
+            self.save(update_fields=["wishlist"])
+        if GroupMember.group.is_cached(self):
+            self.group.refresh_from_db(fields=Group.COUNTER_FIELDS)
+
+
+# The receivers below keep the `Group` counters in step with every way a
+# membership can be created, changed or deleted, including the admin, plain
+# `save()` calls and the cascade from deleting a `User`.
+
+
+@receiver(pre_save, sender=GroupMember)
+def _membership_saving(sender, instance, update_fields=None, **kwargs):
+    # Remember what is stored now, for `_membership_saved` to compare against.
+    instance._stored_membership = None
+    if instance._state.adding:
+        return
+    if update_fields is not None and not {"group", "wishlist"} & set(update_fields):
+        return
+    instance._stored_membership = (
+        GroupMember.objects.filter(pk=instance.pk)
+        .values_list("group_id", "wishlist")
+        .first()
+    )
+
+
+@receiver(post_save, sender=GroupMember)
+def _membership_saved(sender, instance, created, **kwargs):
+    stored = getattr(instance, "_stored_membership", None)
+    instance._stored_membership = None
+    if created:
+        # Also covers a row saved again after it was deleted.
+        Group.adjust_counts(
+            instance.group_id, members=1, wishlists=int(instance.has_wishlist)
+        )
+        return
+    if stored is None:
+        # Neither the group nor the wishlist were saved.
+        return
+
+    group_id, wishlist = stored
+    if group_id != instance.group_id:
+        Group.adjust_counts(group_id, members=-1, wishlists=-int(bool(wishlist)))
+        Group.adjust_counts(
+            instance.group_id, members=1, wishlists=int(instance.has_wishlist)
+        )
+    elif instance.has_wishlist != bool(wishlist):
+        Group.adjust_counts(
+            group_id, wishlists=int(instance.has_wishlist) - int(bool(wishlist))
+        )
+
+
+@receiver(post_delete, sender=GroupMember)
+def _membership_deleted(sender, instance, origin=None, **kwargs):
+    # Deleting a `Group` cascades to its members; its counters go with it.
+    if isinstance(origin, Group) and origin.pk == instance.group_id:
+        return
+    if isinstance(origin, models.QuerySet) and origin.model is Group:
+        return
+    Group.adjust_counts(
+        instance.group_id, members=-1, wishlists=-int(instance.has_wishlist)
+    )
@@ -0,0 +1,212 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from santa import forms, models
+
+
+class GroupCountsTestCase(TestCase):
+    def setUp(self):
+        self.creator = User.objects.create_user("creator")
+        self.user = User.objects.create_user("member")
+        self.group = models.Group.objects.create(
+            name="Office",
+            created_by=self.creator,
+            event_date=datetime.date(2026, 12, 24),
+        )
+        self.group.add_member(self.creator)
+
+    def assertCounts(self, members, wishlists):
+        group = models.Group.objects.get(pk=self.group.pk)
+        self.assertEqual(
+            (group.member_count, group.wishlist_count), (members, wishlists)
+        )
+
+
+class MembershipCountsTests(GroupCountsTestCase):
+    def test_join(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse("santa:join_group", args=[self.group.pk]))
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_join_twice(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse("santa:join_group", args=[self.group.pk]))
+        self.client.get(reverse("santa:join_group", args=[self.group.pk]))
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_add_member_refreshes_instance(self):
+        self.group.add_member(self.user)
+        self.assertEqual(self.group.member_count, 2)
+
+    def test_leave_without_wishlist(self):
+        self.group.add_member(self.user)
+        self.client.force_login(self.user)
+        self.client.post(reverse("santa:leave_group", args=[self.group.pk]))
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_leave_with_wishlist(self):
+        self.group.add_member(self.user).update_wishlist("Socks")
+        self.assertCounts(members=2, wishlists=1)
+        self.client.force_login(self.user)
+        self.client.post(reverse("santa:leave_group", args=[self.group.pk]))
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_leave_requires_post(self):
+        self.group.add_member(self.user)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("santa:leave_group", args=[self.group.pk]))
+        self.assertEqual(response.status_code, 405)
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_cannot_leave_matched_group(self):
+        self.group.add_member(self.user)
+        models.Group.objects.filter(pk=self.group.pk).update(is_matched=True)
+        self.client.force_login(self.user)
+        self.client.post(reverse("santa:leave_group", args=[self.group.pk]))
+        self.assertTrue(self.group.members.filter(pk=self.user.pk).exists())
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_remove_non_member(self):
+        self.assertFalse(self.group.remove_member(self.user))
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_user_delete_cascades(self):
+        self.group.add_member(self.user).update_wishlist("Socks")
+        self.user.delete()
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_stale_save_keeps_counts(self):
+        stale = models.Group.objects.get(pk=self.group.pk)
+        self.group.add_member(self.user)
+        stale.is_matched = True
+        stale.save()
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_save_after_row_deleted(self):
+        models.Group.objects.filter(pk=self.group.pk).delete()
+        self.group.save()
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_force_insert_after_row_deleted(self):
+        models.Group.objects.filter(pk=self.group.pk).delete()
+        self.group.save(force_insert=True)
+        self.assertCounts(members=1, wishlists=0)
+
+
+class DirectMembershipCountsTests(GroupCountsTestCase):
+    """
+    Memberships created, changed and deleted without the `Group` helpers.
+    """
+
+    def test_create_then_delete_user(self):
+        models.GroupMember.objects.create(user=self.user, group=self.group)
+        self.assertCounts(members=2, wishlists=0)
+        self.user.delete()
+        self.assertCounts(members=1, wishlists=0)
+
+    def test_create_then_delete_group(self):
+        models.GroupMember.objects.create(
+            user=self.user, group=self.group, wishlist="Socks"
+        )
+        self.assertCounts(members=2, wishlists=1)
+        # Collect, unset recipients, delete members, delete the group; no
+        # counter updates on the row that is going away.
+        with self.assertNumQueries(4):
+            self.group.delete()
+        self.assertFalse(models.Group.objects.exists())
+
+    def test_delete_with_drifted_counter(self):
+        models.GroupMember.objects.create(user=self.user, group=self.group)
+        models.Group.objects.filter(pk=self.group.pk).update(member_count=0)
+        self.user.delete()
+        self.assertCounts(members=0, wishlists=0)
+
+    def test_plain_save(self):
+        membership = models.GroupMember.objects.create(user=self.user, group=self.group)
+        membership.wishlist = "Socks"
+        membership.save()
+        self.assertCounts(members=2, wishlists=1)
+        membership.save()
+        self.assertCounts(members=2, wishlists=1)
+
+    def test_form_save(self):
+        membership = models.GroupMember.objects.create(user=self.user, group=self.group)
+        form = forms.WishListForm({"wishlist": "Socks"}, instance=membership)
+        form.save()
+        self.assertCounts(members=2, wishlists=1)
+
+    def test_unrelated_save(self):
+        membership = models.GroupMember.objects.create(
+            user=self.user, group=self.group, wishlist="Socks"
+        )
+        membership.save(update_fields=["recipient"])
+        self.assertCounts(members=2, wishlists=1)
+
+    def test_move_between_groups(self):
+        other = models.Group.objects.create(
+            name="Family",
+            created_by=self.creator,
+            event_date=datetime.date(2026, 12, 25),
+        )
+        membership = models.GroupMember.objects.create(
+            user=self.user, group=self.group, wishlist="Socks"
+        )
+        membership.group = other
+        membership.save()
+        self.assertCounts(members=1, wishlists=0)
+        other.refresh_from_db()
+        self.assertEqual((other.member_count, other.wishlist_count), (1, 1))
+
+
+class WishlistCountsTests(GroupCountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.membership = self.group.add_member(self.user)
+
+    def test_empty_filled_empty(self):
+        self.membership.update_wishlist("Socks")
+        self.assertCounts(members=2, wishlists=1)
+        self.membership.update_wishlist("Books")
+        self.assertCounts(members=2, wishlists=1)
+        self.membership.update_wishlist("")
+        self.assertCounts(members=2, wishlists=0)
+        self.membership.update_wishlist(None)
+        self.assertCounts(members=2, wishlists=0)
+
+    def test_view(self):
+        url = reverse("santa:update_wishlist", args=[self.group.pk])
+        self.client.force_login(self.user)
+        self.client.post(url, {"wishlist": "Socks"})
+        self.assertCounts(members=2, wishlists=1)
+        self.client.post(url, {"wishlist": ""})
+        self.assertCounts(members=2, wishlists=0)
+
+
+class RepairGroupCountsTests(GroupCountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.group.add_member(self.user).update_wishlist("Socks")
+        models.Group.objects.filter(pk=self.group.pk).update(
+            member_count=7, wishlist_count=0
+        )
+
+    def test_dry_run(self):
+        stdout = StringIO()
+        call_command("repair_group_counts", dry_run=True, stdout=stdout)
+        self.assertIn("members 7 -> 2, wishlists 0 -> 1", stdout.getvalue())
+        self.assertCounts(members=7, wishlists=0)
+
+    def test_repair(self):
+        call_command("repair_group_counts", stdout=StringIO())
+        self.assertCounts(members=2, wishlists=1)
+
+    def test_repair_leaves_correct_groups_alone(self):
+        call_command("repair_group_counts", stdout=StringIO())
+        stdout = StringIO()
+        call_command("repair_group_counts", stdout=stdout)
+        self.assertIn("Repaired 0 group(s).", stdout.getvalue())
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection
+from django.test import SimpleTestCase
+
+from santa.management.commands.startup_profile import _parse_importtime
+from secretsanta.warmup import warm_up
+
+IMPORTTIME_REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:        50 |         50 |     django.utils.version
+import time:       900 |        950 |   django
+"""
+
+
+class ParseImportTimeTests(SimpleTestCase):
+    def test_parses_modules_and_skips_header(self):
+        self.assertEqual(
+            _parse_importtime(IMPORTTIME_REPORT),
+            [
+                ("_io", 120, 120),
+                ("io", 300, 420),
+                ("django.utils.version", 50, 50),
+                ("django", 900, 950),
+            ],
+        )
+
+    def test_ignores_unrelated_output(self):
+        self.assertEqual(_parse_importtime("Traceback (most recent call last):"), [])
+
+
+class WarmUpTests(SimpleTestCase):
+    def test_runs_requested_steps(self):
+        timings = warm_up(["urls", "translations"])
+        self.assertEqual(list(timings), ["urls", "translations"])
+
+    def test_skips_steps(self):
+        self.assertEqual(
+            list(warm_up(["urls", "database"], skip=["database"])), ["urls"]
+        )
+
+    def test_defaults_to_setting(self):
+        with self.settings(STARTUP_PREWARM=("translations",)):
+            self.assertEqual(list(warm_up()), ["translations"])
+
+    def test_unknown_step(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "urlz"):
+            warm_up(["urls", "urlz"])
+
+    def test_unreachable_database_is_logged(self):
+        with mock.patch.object(
+            connection, "ensure_connection", side_effect=OperationalError
+        ), self.assertLogs("secretsanta.warmup", "WARNING") as logs:
+            warm_up(["database"])
+        self.assertIn("'default'", logs.output[0])
+
+
+class StartupProfileTests(SimpleTestCase):
+    def test_within_budget(self):
+        stdout = StringIO()
+        call_command("startup_profile", runs=1, max_ms=60_000, stdout=stdout)
+        self.assertIn("total imports", stdout.getvalue())
+        self.assertIn("Within the 60000 ms budget.", stdout.getvalue())
+
+    def test_over_budget(self):
+        with self.assertRaisesMessage(CommandError, "exceeds the 0 ms budget"):
+            call_command("startup_profile", runs=1, max_ms=0, stdout=StringIO())
+
+    def test_production_budget(self):
+        # Runs under the production profile so that the configured
+        # STARTUP_TIME_BUDGET_MS, not a test value, is what gets checked.
+        result = subprocess.run(
+            [
+                sys.executable,
+                "manage.py",
+                "startup_profile",
+                "--settings",
+                "secretsanta.settings_production",
+            ],
+            capture_output=True,
+            cwd=settings.BASE_DIR,
+            env={
+                **{
+                    key: value
+                    for key, value in os.environ.items()
+                    if key != "DJANGO_STARTUP_TIME_BUDGET_MS"
+                },
+                "DJANGO_SECRET_KEY": "test",
+            },
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Within the 600 ms budget.", result.stdout)
@@ -11,6 +11,7 @@ urlpatterns = [
     path("group/<int:pk>/", views.GroupDetailView.as_view(), name="group_detail"),
     # Member management
     path("group/<int:group_id>/join/", views.join_group, name="join_group"),
+    path("group/<int:group_id>/leave/", views.leave_group, name="leave_group"),
     path(
         "group/<int:group_id>/wishlist/", views.update_wishlist, name="update_wishlist"
     ),
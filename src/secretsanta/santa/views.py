@@ -4,6 +4,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy
+from django.views.decorators.http import require_POST
 from django.views.generic import (
     CreateView,
     DetailView,
@@ -32,7 +33,7 @@ class GroupCreateView(LoginRequiredMixin, CreateView):
         form.instance.created_by = self.request.user
         response = super().form_valid(form)
 
-        models.GroupMember.objects.create(user=self.request.user, group=self.object)
+        self.object.add_member(self.request.user)
         messages.success(
             self.request,
             gettext_lazy(f"Group {self.object.name} Created successfully!"),
@@ -62,7 +63,7 @@ class GroupDetailView(LoginRequiredMixin, DetailView):
 def join_group(request, group_id):
     group = get_object_or_404(models.Group, id=group_id)
     if not group.members.filter(id=request.user.id).exists():
-        models.GroupMember.objects.create(user=request.user, group=group)
+        group.add_member(request.user)
         messages.success(
             request,
             gettext_lazy(
@@ -72,6 +73,28 @@ def join_group(request, group_id):
     return redirect("santa:group_detail", pk=group_id)
 
 
+@login_required
+@require_POST
+def leave_group(request, group_id):
+    group = get_object_or_404(models.Group, id=group_id)
+    if group.is_matched:
+        # Leaving would unset other members' recipients and break the draw.
+        messages.error(
+            request,
+            gettext_lazy("You cannot leave a group once the matches are done."),
+        )
+        return redirect("santa:group_detail", pk=group_id)
+    if group.created_by == request.user:
+        messages.error(request, gettext_lazy("The creator of a group cannot leave it."))
+        return redirect("santa:group_detail", pk=group_id)
+    if group.remove_member(request.user):
+        messages.success(
+            request,
+            gettext_lazy(f"{request.user.username} has left {group.name}."),
+        )
+    return redirect("santa:group_list")
+
+
 @login_required
 def update_wishlist(request, group_id):
     membership = get_object_or_404(
@@ -82,7 +105,7 @@ def update_wishlist(request, group_id):
     if request.method == "POST":
         form = forms.WishListForm(request.POST, instance=membership)
         if form.is_valid():
-            form.save()
+            membership.update_wishlist(form.cleaned_data["wishlist"])
             messages.success(request, gettext_lazy("Wishlist updated successfully!"))
             return redirect("santa:group_detail", pk=group_id)
     else:
@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "secretsanta.settings")
 
 application = get_asgi_application()
+
+from secretsanta.warmup import warm_up  # noqa: E402
+
+# Requests are served from executor threads (and this may run inside the
+# server's event loop), so a connection opened here would never be reused.
+warm_up(skip=("database",))
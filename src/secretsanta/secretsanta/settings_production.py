@@ -0,0 +1,69 @@
+"""
+Production settings for secretsanta, tuned for worker cold start.
+
+Select with ``DJANGO_SETTINGS_MODULE=secretsanta.settings_production``. The
+following environment variables are read:
+
+* ``DJANGO_SECRET_KEY`` (required);
+* ``DJANGO_ALLOWED_HOSTS``, a comma separated list of host names. With
+  ``DEBUG`` off, Django answers every request with 400 Bad Request unless its
+  host is listed here, so a worker started without it serves nothing;
+* ``DJANGO_CONN_MAX_AGE`` and ``DJANGO_STARTUP_TIME_BUDGET_MS`` (optional).
+
+On top of the base settings this profile:
+
+* pre-warms the URL resolver (which also imports the admin) and translation
+  catalogs from the WSGI/ASGI entry points, so the first request served by a
+  worker does not pay for them;
+* keeps database connections open between requests. Set
+  ``DJANGO_CONN_MAX_AGE=0`` when serving through ASGI or a threaded WSGI
+  server, where persistent connections are not reused reliably. The
+  connection itself is best opened from a per-worker hook, see
+  ``secretsanta.warmup``.
+
+Use ``manage.py startup_profile`` to measure the cold start against
+``STARTUP_TIME_BUDGET_MS``.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F403
+from .settings import DATABASES
+
+try:
+    SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
+except KeyError:
+    raise ImproperlyConfigured(
+        "The DJANGO_SECRET_KEY environment variable is required in production."
+    ) from None
+
+DEBUG = False
+
+ALLOWED_HOSTS = [
+    host for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",") if host
+]
+
+
+# Database
+
+DATABASES = {
+    alias: {
+        **database,
+        "CONN_MAX_AGE": int(os.environ.get("DJANGO_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+    }
+    for alias, database in DATABASES.items()
+}
+
+
+# Startup
+
+# Work done by `secretsanta.warmup.warm_up` when a worker boots.
+STARTUP_PREWARM = ("urls", "translations")
+
+# Cold-start budget (import of the entry point, including pre-warming) that
+# `manage.py startup_profile` checks against: about twice the measured median
+# of ~300 ms, so that noise passes but a real regression does not.
+STARTUP_TIME_BUDGET_MS = int(os.environ.get("DJANGO_STARTUP_TIME_BUDGET_MS", 600))
@@ -0,0 +1,98 @@
+"""
+Startup warm-up for the secretsanta WSGI/ASGI entry points.
+
+Django loads the URLconf, the translation catalogs and the database connection
+lazily, so the first request served by a fresh worker pays for all of them.
+``warm_up`` front-loads that work while the worker is starting, driven by the
+``STARTUP_PREWARM`` setting (see ``secretsanta.settings_production``).
+
+Database connections are per thread and must not be shared across forks, so
+the ``database`` step is not meant for import time. Run it from a per-worker
+hook in the thread that serves requests instead, e.g. for sync gunicorn
+workers::
+
+    def post_worker_init(worker):
+        from secretsanta.warmup import warm_up
+
+        warm_up(["database"])
+
+The ASGI entry point always skips it, since requests there are served from
+executor threads that would never reuse the connection.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError, connections
+from django.urls import get_resolver
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_urls():
+    # Loading the URLconf also imports the views, forms and the admin site.
+    get_resolver().reverse_dict
+
+
+def _warm_translations():
+    with translation.override(settings.LANGUAGE_CODE):
+        pass
+
+
+def _warm_database():
+    for connection in connections.all():
+        try:
+            connection.ensure_connection()
+        except DatabaseError:
+            # The first request will retry; an unreachable database must not
+            # keep the worker from booting.
+            logger.warning(
+                "Could not pre-warm the %r database connection",
+                connection.alias,
+                exc_info=True,
+            )
+
+
+STEPS = {
+    "urls": _warm_urls,
+    "translations": _warm_translations,
+    "database": _warm_database,
+}
+
+
+def warm_up(steps=None, skip=()):
+    """
+    Runs the requested warm-up steps in order.
+
+    Parameters
+    ----------
+        steps: Names of the steps to run, out of ``STEPS``. Defaults to the
+            ``STARTUP_PREWARM`` setting, which is empty unless configured.
+        skip: Names of steps to leave out even if they were requested.
+
+    Returns
+    -------
+        A dict mapping each step that ran to its duration in seconds.
+    """
+    if steps is None:
+        steps = getattr(settings, "STARTUP_PREWARM", ())
+
+    unknown = [step for step in steps if step not in STEPS]
+    if unknown:
+        raise ImproperlyConfigured(
+            f"Unknown STARTUP_PREWARM step(s) {', '.join(unknown)}; "
+            f"expected any of {', '.join(STEPS)}."
+        )
+
+    timings = {}
+    for step in steps:
+        if step in skip:
+            continue
+        started = time.perf_counter()
+        STEPS[step]()
+        timings[step] = time.perf_counter() - started
+        logger.debug("Pre-warmed %s in %.1f ms", step, timings[step] * 1000)
+    return timings